@@ -1,28 +1,64 @@
+import atexit
+import functools
+import heapq
+import itertools
 import os
 import pathlib
 import re
+import threading
+import weakref
 from typing import Optional, Type
 
-import appdirs
 import settings
 
+_VERSION_RE = re.compile(r"settings-(\d+)")
+
+# Managers with a possibly pending debounced write, tracked weakly so the hook does not
+# pin them alive for the life of the process
+_MANAGERS = weakref.WeakSet()
+_MANAGER_COUNTER = itertools.count()
+
+
+@atexit.register
+def _flush_all_pending():
+    """Atexit hook, persist writes still waiting on a debounce timer.
+
+    Flushed in creation order so that with several managers over the same settings file
+    the most recently created one writes last and its value wins.
+    """
+    # pylint: disable=protected-access
+    for pending_manager in sorted(_MANAGERS, key=lambda item: item._creation_index):
+        if pending_manager._dirty:
+            pending_manager.flush()
+
 
 class Manager:
     SETTINGS_NAME_PREFIX = "settings-"
+    # Debounce window for writes triggered through the settings setter, burst assignments
+    # inside this window collapse into a single serialize + write
+    FLUSH_DELAY_SECONDS = 0.05
 
     def __init__(self, project_name: str, settings_type, config_path: Optional[pathlib.Path] = None):
         assert project_name, "project_name should be not empty"
         assert issubclass(settings_type, settings.BaseSettings), "settings_type should use BaseSettings as subclass"
 
         self.project_name = project_name
-        self.config_path = (
-            config_path.joinpath(project_name)
-            if config_path
-            else pathlib.Path(appdirs.user_config_dir(self.project_name))
-        )
-        self.config_path.mkdir(parents=True, exist_ok=True)
+        if config_path:
+            self.config_path = config_path.joinpath(project_name)
+        else:
+            # appdirs is only necessary when no explicit path is given, avoid paying its import at module load
+            import appdirs  # pylint: disable=import-outside-toplevel
+
+            self.config_path = pathlib.Path(appdirs.user_config_dir(self.project_name))
+        settings._ensure_dir(self.config_path)  # pylint: disable=protected-access
         self.settings_type = settings_type
+        settings.prewarm(settings_type)
         self._settings = None
+        self._write_lock = threading.Lock()
+        self._flush_timer = None
+        self._dirty = False
+        self._creation_index = next(_MANAGER_COUNTER)
+        _MANAGERS.add(self)
 
     @property
     def settings(self) -> Type["self.settings_type"]:
@@ -38,7 +74,7 @@ class Manager:
 
     @settings.setter
     def settings(self, value: Type["self.settings_type"]):
-        """Setter point for settings, save settings in any change
+        """Setter point for settings, schedule a debounced save on any change
 
         Args:
             value ([self.settings_type]): The settings defined in the constructor
@@ -46,11 +82,18 @@ class Manager:
         if not self._settings:
             self.load()
 
-        self._settings = value
-        self.save()
+        with self._write_lock:
+            self._settings = value
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(Manager.FLUSH_DELAY_SECONDS, self._debounced_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
+    @functools.cached_property
     def settings_file_path(self) -> pathlib.Path:
-        """Return the settings file for the version specified in the constructor settings
+        """Settings file for the version specified in the constructor settings,
+        computed once since config_path and settings_type are fixed after construction
 
         Returns:
             pathlib.Path: Path for the settings file
@@ -79,23 +122,53 @@ class Manager:
 
         return settings_data
 
+    def _debounced_flush(self):
+        """Timer callback, persist the latest settings if they are still dirty"""
+        with self._write_lock:
+            self._flush_timer = None
+            if not self._dirty:
+                return
+            settings_to_write = self._settings
+            self._dirty = False
+        settings_to_write.save(self.settings_file_path)
+
+    def flush(self):
+        """Cancel any pending debounced write and persist the current settings now"""
+        with self._write_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._dirty = False
+        self.settings.save(self.settings_file_path)
+
     def save(self):
         """Save settings"""
-        self.settings.save(self.settings_file_path())
+        self.flush()
 
     def load(self):
         """Load settings"""
 
-        # Get all possible settings candidates and sort it by version
-        valid_files = [
-            possible_file
-            for possible_file in os.listdir(self.config_path)
-            if possible_file.startswith(Manager.SETTINGS_NAME_PREFIX)
-        ]
-        valid_files.sort(key=lambda x: int(re.search(f"{Manager.SETTINGS_NAME_PREFIX}(\\d+)", x).group(1)))
-        valid_files.reverse()
+        # Happy path: the file for the current version is already in place, no need to
+        # enumerate and sort the whole config directory
+        if self.settings_file_path.exists():
+            try:
+                self._settings = Manager.load_from_file(self.settings_type, self.settings_file_path)
+                return
+            except settings.SettingsFromTheFuture as exception:
+                print("Invalid settings, going to try another file:", exception)
 
-        for valid_file in valid_files:
+        # Get all possible settings candidates as a max-heap over the version number, usually
+        # only the highest versions are tried so there is no need to fully sort the list
+        with os.scandir(self.config_path) as entries:
+            candidates = [
+                (-int(_VERSION_RE.search(entry.name).group(1)), entry.name)
+                for entry in entries
+                if entry.name.startswith(Manager.SETTINGS_NAME_PREFIX)
+            ]
+        heapq.heapify(candidates)
+
+        while candidates:
+            _, valid_file = heapq.heappop(candidates)
             file_path = self.config_path.joinpath(valid_file)
             try:
                 self._settings = Manager.load_from_file(self.settings_type, file_path)
@@ -103,4 +176,4 @@ class Manager:
             except settings.SettingsFromTheFuture as exception:
                 print("Invalid settings, going to try another file:", exception)
         else:
-            self._settings = Manager.load_from_file(self.settings_type, self.settings_file_path())
+            self._settings = Manager.load_from_file(self.settings_type, self.settings_file_path)
@@ -1,10 +1,152 @@
-import abc
+import functools
+import hashlib
 import json
+import mmap
+import os
 import pathlib
+import tempfile
+from typing import Callable, Dict, Optional
 
 import pykson
 from pykson import Pykson
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+    _HAS_ORJSON = False
+
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+try:
+    import simdjson
+
+    _SIMDJSON_PARSER = simdjson.Parser()
+except ImportError:
+    _SIMDJSON_PARSER = None
+
+# mmap setup cost only pays off on larger files, and only orjson/simdjson accept
+# buffer-protocol input without an intermediate copy
+_MMAP_THRESHOLD = 64 * 1024
+_MMAP_CAPABLE = _HAS_ORJSON or _SIMDJSON_PARSER is not None
+
+
+# Pykson's constructor builds reflection caches, one shared instance is enough
+_PYKSON = Pykson()
+
+# Sentinel to detect a missing VERSION key in a single dict lookup
+_MISSING = object()
+
+# Process umask, read once at import time. os.umask can only be read by setting it, and
+# toggling it per save would race other threads creating files (saves run on the
+# debounce timer thread), briefly leaving the whole process with a zeroed umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Directories already created or verified, avoids a stat + mkdir pair on every save
+_KNOWN_DIRS = set()
+
+
+def _ensure_dir(path: pathlib.Path):
+    """Create path if necessary, remembering directories that are known to exist
+
+    Args:
+        path (pathlib.Path): Directory that should exist
+    """
+    if path not in _KNOWN_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _KNOWN_DIRS.add(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_set(cls) -> frozenset:
+    """Serialized field names of a settings class as a frozenset, cached per class"""
+    return frozenset(field.serialized_name for field in _class_fields(cls).values())
+
+
+@functools.lru_cache(maxsize=None)
+def _field_applier(cls) -> Optional[Callable]:
+    """Straight-line dict to instance field copy function compiled for cls, cached per class.
+    None when the class has object fields that Pykson must materialize instead
+    """
+    fields = _class_fields(cls)
+    if any(isinstance(field, (pykson.ObjectField, pykson.ObjectListField)) for field in fields.values()):
+        return None
+
+    # The schema is fixed at class-definition time, so the copy loop can be unrolled once
+    # into plain assignments instead of iterating names and dispatching setattr per load
+    lines = ["def _apply(self, data):"]
+    for name, field in fields.items():
+        key = field.serialized_name
+        lines.append(f"    if {key!r} in data:")
+        lines.append(f"        self.{name} = data[{key!r}]")
+        lines.append("    else:")
+        lines.append(f"        self._data.pop({key!r}, None)")
+    namespace = {}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["_apply"]
+
+
+@functools.lru_cache(maxsize=None)
+def prewarm(cls):
+    """Build the per-class caches and Pykson's reflection state ahead of the first load,
+    so the one-time cost is paid at startup instead of inside a latency-sensitive load
+
+    Args:
+        cls: Settings class that inherits from BaseSettings
+    """
+    fields = _class_fields(cls)
+    _field_set(cls)
+    _migration_chain(cls)
+    if _field_applier(cls) is None:
+        # Object fields go through Pykson, exercise its class-to-schema caches once
+        # with a minimal document built from the simple field defaults
+        defaults = {
+            field.serialized_name: field.default_value
+            for field in fields.values()
+            if field.default_value is not None
+            and not isinstance(field, (pykson.ObjectField, pykson.ObjectListField))
+        }
+        try:
+            _PYKSON.from_json(defaults, cls)
+        except Exception:  # pylint: disable=broad-except
+            # Best-effort warmup only, a class that needs richer input to deserialize
+            # must not fail at construction time
+            pass
+
+
+@functools.lru_cache(maxsize=None)
+def _migration_chain(cls) -> dict:
+    """Merged _MIGRATIONS map of a settings class and its bases, cached per class"""
+    chain = {}
+    for klass in reversed(cls.__mro__):
+        chain.update(vars(klass).get("_MIGRATIONS", {}))
+    return chain
+
+
+@functools.lru_cache(maxsize=None)
+def _class_fields(cls) -> dict:
+    """Map of attribute name to pykson field descriptor for a settings class, cached per class"""
+    fields = {}
+    for klass in reversed(cls.__mro__):
+        for name, field in vars(klass).items():
+            if isinstance(field, pykson.Field):
+                fields[name] = field
+    return fields
+
 
 class BadSettingsFile(ValueError):
     """Settings file is not valid."""
@@ -27,19 +169,65 @@ class BaseSettings(pykson.JsonObject):
 
     VERSION = pykson.IntegerField(default_value=0)
 
+    # Declarative migration chain: maps a target version to a callable that updates the
+    # data dict from the previous version. Subclasses can register their steps here
+    # instead of overriding migrate() and hand-chaining super() calls.
+    _MIGRATIONS: Dict[int, Callable[[dict], None]] = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._last_saved = None
 
-    @abc.abstractmethod
     def migrate(self, data: dict):
-        """Function used to migrate from previous settings verion
+        """Migrate data from a previous settings version by applying every registered
+        _MIGRATIONS step from the data version up to the current one
 
         Args:
             data (dict): Data from the previous version settings
         """
-        raise RuntimeError(
-            "Migrate function from base class was called, settings file appears to be not possible to be migrated"
-        )
+        migrations = _migration_chain(self.__class__)
+        if not migrations:
+            raise RuntimeError(
+                "Migrate function from base class was called, settings file appears to be not possible to be migrated"
+            )
+
+        # Version numbers are sparse (e.g. a jump from 3 straight to 12), apply only the
+        # steps registered between the file version and the current one
+        applicable = sorted(version for version in migrations if data["VERSION"] < version <= self.VERSION)
+        if not applicable and data["VERSION"] < self.VERSION:
+            raise MigrationFail(f"No migration registered to update from settings version {data['VERSION']}")
+        for version in applicable:
+            migrations[version](data)
+        data["VERSION"] = self.VERSION
+
+    def _parse(self, raw) -> dict:
+        """Parse raw settings content (bytes or any buffer) into a dict
+
+        Args:
+            raw: Serialized settings content
+
+        Returns:
+            dict: Parsed settings data
+        """
+        if _SIMDJSON_PARSER is not None:
+            # On-Demand parse: the version gate can reject a future file before
+            # the whole document is materialized into Python objects
+            document = _SIMDJSON_PARSER.parse(raw)
+            try:
+                version = document["VERSION"]
+                if version > self.VERSION:
+                    raise SettingsFromTheFuture(
+                        f"Settings file comes from a future settings version: {version}, "
+                        f"latest supported: {self.VERSION}, tomorrow does not exist"
+                    )
+            except KeyError:
+                # Missing VERSION is reported by load with the full file content
+                pass
+            result = document.as_dict()
+            # The parser reuses its buffer on the next parse, drop the document now
+            del document
+            return result
+        return _loads(raw)
 
     def load(self, file_path: pathlib.Path):
         """Load settings from file
@@ -50,33 +238,55 @@ class BaseSettings(pykson.JsonObject):
         if not file_path.exists():
             raise RuntimeError(f"Settings file does not exist: {file_path}")
 
-        with open(file_path, encoding="utf-8") as settings_file:
-            result = json.load(settings_file)
+        with open(file_path, "rb") as settings_file:
+            if _MMAP_CAPABLE and os.fstat(settings_file.fileno()).st_size >= _MMAP_THRESHOLD:
+                # Large file: parse straight out of the page cache instead of copying
+                # the whole payload into an intermediate bytes object first
+                with mmap.mmap(settings_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    try:
+                        result = self._parse(view)
+                    finally:
+                        view.release()
+            else:
+                result = self._parse(settings_file.read())
 
-            if "VERSION" not in result.keys():
-                raise BadSettingsFile(f"Settings file does not appears to contain a valid settings format: {result}")
+        version = result.get("VERSION", _MISSING)
+        if version is _MISSING:
+            raise BadSettingsFile(f"Settings file does not appears to contain a valid settings format: {result}")
 
-            version = result["VERSION"]
+        if version == 0:
+            raise BadAttributes("Settings file contains invalid version number")
 
-            if version == 0:
-                raise BadAttributes("Settings file contains invalid version number")
+        if version > self.VERSION:
+            raise SettingsFromTheFuture(
+                f"Settings file comes from a future settings version: {version}, "
+                f"latest supported: {self.VERSION}, tomorrow does not exist"
+            )
 
-            if version > self.VERSION:
-                raise SettingsFromTheFuture(
-                    f"Settings file comes from a future settings version: {version}, "
-                    f"latest supported: {self.VERSION}, tomorrow does not exist"
-                )
+        if version < self.VERSION:
+            self.migrate(result)
+            version = result["VERSION"]
 
-            if version < self.VERSION:
-                self.migrate(result)
-                version = result["VERSION"]
+        if version != self.VERSION:
+            raise MigrationFail("Migrate chain failed to update to the latest settings version available")
 
-            if version != self.VERSION:
-                raise MigrationFail("Migrate chain failed to update to the latest settings version available")
+        # One set difference instead of a per-key schema walk
+        unknown = result.keys() - _field_set(self.__class__)
+        if unknown:
+            raise BadAttributes(f"Settings file contains unknown attributes: {sorted(unknown)}")
 
-            # Copy new content to settings class
-            new = Pykson().from_json(result, self.__class__)
-            self.__dict__.update(new.__dict__)
+        # Copy new content to settings class. Simple fields are assigned straight from the
+        # parsed dict by the compiled applier, object fields still need Pykson to
+        # materialize the nested instances
+        applier = _field_applier(self.__class__)
+        if applier is None:
+            new = _PYKSON.from_json(result, self.__class__)
+            for name in _class_fields(self.__class__):
+                setattr(self, name, getattr(new, name))
+            return
+
+        applier(self, result)
 
     def save(self, file_path: pathlib.Path):
         """Save settings to file
@@ -86,13 +296,33 @@ class BaseSettings(pykson.JsonObject):
         """
         # Path for settings file does not exist, lets ensure that it does
         parent_path = file_path.parent.absolute()
-        if not parent_path.exists():
-            parent_path.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(parent_path)
+
+        payload = _dumps(_PYKSON.to_dict_or_list(self))
+        payload_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._last_saved == (file_path, payload_hash) and file_path.exists():
+            return
 
-        with open(file_path, "w", encoding="utf-8") as settings_file:
-            settings_file.write(Pykson().to_json(self))
+        # Write to a temporary file on the same filesystem and swap it atomically in place,
+        # a crash mid-write can not leave a torn settings file behind
+        with tempfile.NamedTemporaryFile(dir=parent_path, delete=False) as temporary_file:
+            temporary_file.write(payload)
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+            # NamedTemporaryFile is created 0600, give the settings file the
+            # umask-derived mode a regular open would have used.
+            # chmod by name, fd-based chmod is not supported on Windows
+            os.chmod(temporary_file.name, 0o666 & ~_UMASK)
+        os.replace(temporary_file.name, file_path)
+        self._last_saved = (file_path, payload_hash)
 
     def reset(self):
         """Reset internal data to default values"""
+        # Per-field assignment rather than a wholesale __dict__ copy, which would leave
+        # this instance sharing the pykson field storage of the temporary one.
+        # __slots__ would be the next step but pykson's JsonObject keeps field values in
+        # a per-instance dict and defines no slots itself, so there is nothing to gain.
         new = self.__class__()
-        self.__dict__.update(new.__dict__)
+        for name in _class_fields(self.__class__):
+            setattr(self, name, getattr(new, name))
+        self._last_saved = None
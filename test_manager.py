@@ -1,6 +1,9 @@
 import os
 import pathlib
 import tempfile
+import time
+
+import pytest
 
 import manager
 import pykson
@@ -87,6 +90,44 @@ class SettingsV12(SettingsV3):
         data["version_12_variable"] = self.version_12_variable
 
 
+class DeclarativeV1(settings.BaseSettings):
+    VERSION = 1
+    version_1_variable = pykson.IntegerField(default_value=42)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.VERSION = DeclarativeV1.VERSION
+
+
+class DeclarativeV12(DeclarativeV1):
+    VERSION = 12
+    version_12_variable = pykson.IntegerField(default_value=0)
+
+    _MIGRATIONS = {
+        12: lambda data: data.__setitem__("version_12_variable", 1992),
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.VERSION = DeclarativeV12.VERSION
+
+
+class DeclarativeV20(DeclarativeV1):
+    VERSION = 20
+
+    # No step above version 1, a version 1 file can not be brought forward
+    _MIGRATIONS = {
+        1: lambda data: None,
+    }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.VERSION = DeclarativeV20.VERSION
+
+
 def test_basic_settings_save_load():
     temporary_folder = tempfile.mkdtemp()
     config_path = pathlib.Path(temporary_folder)
@@ -161,6 +202,70 @@ def test_basic_settings_save_load():
     assert len(os.listdir(config_path.joinpath("ManagerTest"))) == 4
 
 
+def test_debounced_setter_save_load():
+    temporary_folder = tempfile.mkdtemp()
+    config_path = pathlib.Path(temporary_folder)
+
+    settings_manager = manager.Manager("ManagerTest", SettingsV1, config_path)
+    settings_manager.load()
+
+    # A burst of assignments collapses into one write of the latest value
+    for value in range(10):
+        new_settings = SettingsV1()
+        new_settings.version_1_variable = value
+        settings_manager.settings = new_settings
+
+    time.sleep(manager.Manager.FLUSH_DELAY_SECONDS * 4)
+
+    settings_manager = manager.Manager("ManagerTest", SettingsV1, config_path)
+    settings_manager.load()
+
+    assert settings_manager.settings.version_1_variable == 9
+
+
+def test_flush_settings_save_load():
+    temporary_folder = tempfile.mkdtemp()
+    config_path = pathlib.Path(temporary_folder)
+
+    settings_manager = manager.Manager("ManagerTest", SettingsV1, config_path)
+    settings_manager.load()
+
+    new_settings = SettingsV1()
+    new_settings.version_1_variable = 123
+    settings_manager.settings = new_settings
+
+    # flush cancels the pending timer and persists synchronously, no waiting required
+    settings_manager.flush()
+
+    settings_manager = manager.Manager("ManagerTest", SettingsV1, config_path)
+    settings_manager.load()
+
+    assert settings_manager.settings.version_1_variable == 123
+
+
+def test_declarative_migration_settings_save_load():
+    temporary_folder = tempfile.mkdtemp()
+    config_path = pathlib.Path(temporary_folder)
+
+    # Save a v1 settings file
+    settings_manager = manager.Manager("ManagerTest", DeclarativeV1, config_path)
+    settings_manager.settings.version_1_variable = 2022
+    settings_manager.save()
+    v1_file_path = settings_manager.settings_file_path
+
+    # Sparse chain: jumping from version 1 straight to 12 applies the single registered step
+    settings_manager = manager.Manager("ManagerTest", DeclarativeV12, config_path)
+    settings_manager.load()
+
+    assert settings_manager.settings.version_1_variable == 2022
+    assert settings_manager.settings.version_12_variable == 1992
+    assert settings_manager.settings.VERSION == DeclarativeV12.VERSION
+
+    # A file older than every registered step fails to migrate
+    with pytest.raises(settings.MigrationFail):
+        DeclarativeV20().load(v1_file_path)
+
+
 def test_fallback_settings_save_load():
     temporary_folder = tempfile.mkdtemp()
     config_path = pathlib.Path(temporary_folder)
@@ -1,6 +1,9 @@
+import json
 import pathlib
 import tempfile
 
+import pytest
+
 import pykson
 import settings
 
@@ -91,6 +94,30 @@ def test_basic_settings_save_load():
     assert settings_v1.first_variable == 42
 
 
+def test_save_skips_unchanged_content():
+    settings_v1 = SettingsV1()
+
+    # pylint: disable=consider-using-with
+    temporary_file = tempfile.NamedTemporaryFile()
+    file_path = pathlib.Path(temporary_file.name)
+
+    settings_v1.save(file_path)
+    first_mtime = file_path.stat().st_mtime_ns
+
+    # Identical content, the file must not be rewritten
+    settings_v1.save(file_path)
+    assert file_path.stat().st_mtime_ns == first_mtime
+
+    # Changed content must hit the disk again
+    settings_v1.first_variable = 66
+    settings_v1.save(file_path)
+    assert file_path.stat().st_mtime_ns != first_mtime
+
+    settings_v1_new = SettingsV1()
+    settings_v1_new.load(file_path)
+    assert settings_v1_new.first_variable == 66
+
+
 def test_nested_settings_save_load():
     # Check basic access
     settings_v1 = SettingsV1()
@@ -143,6 +170,22 @@ def test_simple_migration_settings_save_load():
     assert settings_v1.animal.animal_type == settings_v2.new_animal_name.animal_type
 
 
+def test_load_unknown_attributes():
+    settings_v1 = SettingsV1()
+
+    # pylint: disable=consider-using-with
+    temporary_file = tempfile.NamedTemporaryFile()
+    file_path = pathlib.Path(temporary_file.name)
+
+    settings_v1.save(file_path)
+    data = json.loads(file_path.read_bytes())
+    data["unknown_attribute"] = 13
+    file_path.write_text(json.dumps(data), encoding="utf-8")
+
+    with pytest.raises(settings.BadAttributes):
+        SettingsV1().load(file_path)
+
+
 def test_simple_settings_expanded_save_load():
     settings_v1 = SettingsV1()
 